@@ -108,7 +108,9 @@ class PatchLine:
     of the raw input stream.
     """
 
-    _TRAIL_WS_RE: ClassVar[re.Pattern] = re.compile(r"([ \t\f\v]+)[\n\r]*$")
+    __slots__ = ("_content", "_has_trailing_whitespace")
+
+    _TRAIL_WS_CHARS: ClassVar[tuple[str, ...]] = (" ", "\t", "\f", "\v")
 
     def __init__(self, raw_line: str):
         """
@@ -132,11 +134,13 @@ class PatchLine:
         clean_content = raw_line.removesuffix("\\ No newline at end of file\n").removesuffix(
             "\\ No newline at end of file\r\n"
         )
-        self._has_trailing_whitespace: bool = bool(self._TRAIL_WS_RE.search(clean_content))
-
         # Strip trailing newline characters (\n or \r\n)
         self._content: str = clean_content.rstrip("\n\r")
 
+        # Trailing whitespace is judged on the stripped content: a single
+        # character check instead of a regex scan over every line.
+        self._has_trailing_whitespace: bool = self._content[-1:] in self._TRAIL_WS_CHARS
+
     @property
     def content(self) -> str:
         """
@@ -169,6 +173,8 @@ class HeadLine(PatchLine):
     within a transition.
     """
 
+    __slots__ = ("_prefix", "_info")
+
     def __init__(self, raw_line: str):
         """
         Initializes the HeadLine by extracting the prefix and path content.
@@ -257,18 +263,21 @@ class HeadLine(PatchLine):
         :raises ValueError: If strip_count is too high for the available segments or is negative.
         :returns: A Path object of the remaining segments.
         """
-        p = Path(self.content)
-        segments = p.parts
-
         if strip_count < 0:
             raise ValueError(f"Strip count must be non-negative, got {strip_count}")
 
+        p = Path(self.content)
+        segments = p.parts
+
         if strip_count >= len(segments):
             raise ValueError(
                 f"Strip level -p{strip_count} is too high for path '{self.content}' "
                 f"(only {len(segments)} segments available)."
             )
 
+        # Without stripping the parsed path is already the result
+        if strip_count == 0:
+            return p
         return Path(*segments[strip_count:])
 
     @staticmethod
@@ -325,6 +334,16 @@ class HunkHeadLine(PatchLine):
     and provides parsed access to the line numbers.
     """
 
+    __slots__ = (
+        "_prefix",
+        "_info",
+        "_suffix_marker",
+        "_old_start",
+        "_old_len",
+        "_new_start",
+        "_new_len",
+    )
+
     _HUNK_RE: ClassVar[re.Pattern] = re.compile(
         r"^-(?P<old_start>\d+)(?:,(?P<old_len>\d+))? "
         r"\+(?P<new_start>\d+)(?:,(?P<new_len>\d+))?"
@@ -438,9 +457,14 @@ class FileLine(PatchLine):
     :py:attr:`~FileLine.content` property.
     """
 
+    __slots__ = ("_prefix", "_has_newline", "_normalized_ws", "_ignore_all_ws")
+
     _INTERNAL_WS_RE: ClassVar[re.Pattern] = re.compile(r"([ \t\f\v]+)")
-    _ALL_WS_RE: ClassVar[re.Pattern] = re.compile(r"\s+")
-    # _TRAIL_WS_RE: ClassVar[re.Pattern] = re.compile(r"([ \t\f\v]+)[\n\r]*$")
+    # Deletion table for every character matched by ``\s`` (i.e. ``str.isspace``).
+    # The highest Unicode whitespace code point is U+3000 (ideographic space).
+    _ALL_WS_TABLE: ClassVar[dict[int, None]] = dict.fromkeys(
+        (cp for cp in range(0x3001) if chr(cp).isspace()), None
+    )
 
     def __init__(self, raw_line: str):
         """
@@ -457,6 +481,9 @@ class FileLine(PatchLine):
         self._prefix: str = ""
         super().__init__(raw_line)
         self._has_newline = raw_line.endswith("\n")
+        # Lazily filled caches for the whitespace-normalized content variants
+        self._normalized_ws: str | None = None
+        self._ignore_all_ws: str | None = None
 
     def __repr__(self):
         return "".join(
@@ -486,10 +513,22 @@ class FileLine(PatchLine):
         The line content, dynamically normalized according to the --normalize-ws rule **(ro)**.
 
         Internal whitespace runs collapse to a single space; trailing
-        whitespace is removed; leading whitespace is preserved.
+        whitespace is removed; leading whitespace is preserved. The result is
+        computed on first access and cached, as a file line is compared
+        against the context of every hunk that touches it.
 
         :returns: The normalized string used for matches.
         """
+        if self._normalized_ws is None:
+            self._normalized_ws = self._normalize_ws()
+        return self._normalized_ws
+
+    def _normalize_ws(self) -> str:
+        """
+        Compute the content according to the --normalize-ws rule.
+
+        :returns: The normalized string.
+        """
         content = self._content.replace("\xa0", " ")
 
         # 1. Find the index of the first non-whitespace character and separate
@@ -516,10 +555,13 @@ class FileLine(PatchLine):
         The line content, dynamically normalized according to the --ignore-all-ws rule **(ro)**.
 
         All forms of whitespace (leading, internal, trailing) are removed from the string.
+        The result is computed on first access and cached.
 
         :returns: The string content with all whitespace removed.
         """
-        return self._ALL_WS_RE.sub("", self._content)
+        if self._ignore_all_ws is None:
+            self._ignore_all_ws = self._content.translate(self._ALL_WS_TABLE)
+        return self._ignore_all_ws
 
     # --- Metadata & Convenience Properties ---
 
@@ -599,8 +641,15 @@ class HunkLine(FileLine):
     The class parses the raw diff line upon instantiation and provides
     dynamically calculated, read-only content properties for different
     levels of whitespace normalization.
+
+    The line kind is kept solely in the inherited one-character prefix; the
+    ``is_*`` flags are derived from it on access. Together with the
+    ``__slots__`` of the line hierarchy this keeps the per-line footprint
+    small for large patches.
     """
 
+    __slots__ = ()
+
     def __init__(self, raw_line: str) -> None:
         """
         Initializes the HunkLine by parsing the raw line.
@@ -707,6 +756,8 @@ class Hunk:
     are used as headers.
     """
 
+    __slots__ = ("_header", "_lines")
+
     def __init__(self, header: HunkHeadLine) -> None:
         """
         Initializes a new Hunk with coordinate metadata.
@@ -773,24 +824,24 @@ class Hunk:
         if len(expected) != len(actual):
             return False
 
-        for exp, act in zip(expected, actual, strict=False):
-            # 1. Option: --ignore-blank-lines
-            if getattr(options, "ignore_blank_lines", False):
-                if exp.is_empty and act.is_empty:
-                    continue
+        # 1. Optionen einmal pro Hunk auswerten, nicht pro Zeile
+        ignore_blank_lines = getattr(options, "ignore_blank_lines", False)
 
-            # 2. Vergleich basierend auf den Whitespace-Regeln
-            if getattr(options, "ignore_all_space", False):
-                if exp.ignore_all_ws_content != act.ignore_all_ws_content:
-                    return False
+        if getattr(options, "ignore_all_space", False):
+            compare_attr = "ignore_all_ws_content"
+        elif getattr(options, "ignore_space_change", False):
+            compare_attr = "normalized_ws_content"
+        else:
+            compare_attr = "content"
 
-            elif getattr(options, "ignore_space_change", False):
-                if exp.normalized_ws_content != act.normalized_ws_content:
-                    return False
+        for exp, act in zip(expected, actual, strict=False):
+            # 2. Option: --ignore-blank-lines
+            if ignore_blank_lines and exp.is_empty and act.is_empty:
+                continue
 
-            else:
-                if exp.content != act.content:
-                    return False
+            # 3. Vergleich basierend auf den Whitespace-Regeln
+            if getattr(exp, compare_attr) != getattr(act, compare_attr):
+                return False
 
         return True
 
@@ -813,7 +864,7 @@ class Hunk:
         start_idx = self.old_start - 1
 
         # 2. Erwarteten Kontext extrahieren
-        expected_hunk_lines = [lin for lin in self.lines if not lin.is_addition]
+        expected_hunk_lines = [lin for lin in self.lines if lin.prefix != "+"]
 
         # 3. Validierung der Grenzen
         if start_idx < 0 or (start_idx + len(expected_hunk_lines)) > len(lines):
@@ -831,15 +882,23 @@ class Hunk:
                 "The actual file content does not match the hunk's context."
             )
 
-        # 5. Rekonstruktion der Zeilenliste
+        # 5. Rekonstruktion der Zeilenliste in einem Durchlauf
+        # file_idx wandert über die Originalzeilen; Kontextzeilen werden als
+        # bestehende FileLine-Objekte übernommen, Deletions übersprungen.
         new_lines = lines[:start_idx]
+        file_idx = start_idx
 
         for h_line in self.lines:
-            # Kontext behalten, Additions einfügen, Deletions weglassen
-            if h_line.is_context or h_line.is_addition:
+            # Der Präfix ist die beim Parsen bestimmte Zeilenart
+            kind = h_line.prefix
+            if kind == "+":
                 new_lines.append(FileLine(h_line.line_string))
+                continue
+            if kind == " ":
+                new_lines.append(lines[file_idx])
+            file_idx += 1
 
-        new_lines.extend(lines[start_idx + len(expected_hunk_lines) :])
+        new_lines.extend(lines[file_idx:])
 
         return new_lines
 
@@ -1020,8 +1079,8 @@ class DiffCodeFile:
         :param strip: Number of path components to remove from the start.
         :returns: A Path object for the source file.
         """
-        # Wir delegieren die Arbeit an das HeadLine-Objekt
-        return Path(self.orig_header.get_path(strip))
+        # Wir delegieren die Arbeit an das HeadLine-Objekt (liefert bereits Path)
+        return self.orig_header.get_path(strip)
 
     @property
     def _temp_path(self) -> Path:
@@ -1056,9 +1115,9 @@ class DiffCodeFile:
         """
         Write the patched lines to a temporary file in the staging area.
 
-        Reconstructs the file by writing each FileLine. Python's universal
-        newline handling ensures the output matches the system's standard
-        line endings.
+        Reconstructs the file by joining all FileLines and writing them in a
+        single call. Python's universal newline handling ensures the output
+        matches the system's standard line endings.
 
         :param lines: List of patched FileLine objects.
         :returns: The Path to the generated temporary file.
@@ -1068,8 +1127,7 @@ class DiffCodeFile:
 
         try:
             with temp_file.open("w", encoding="utf-8") as f:
-                for line in lines:
-                    f.write(line.line_string)
+                f.write("".join(line.line_string for line in lines))
             return temp_file
         except (OSError, IOError) as e:
             raise PatchParseError(f"Could not write to staging file {temp_file}: {e}")
@@ -1203,7 +1261,16 @@ class PatchParser:
 
                     current_hunk.add_line(HunkLine(raw_line))
 
-                # 4. Handle Metadata and Noise
+                # 4. Handle '\ No newline at end of file' markers
+                # A plain prefix check suffices; the marker refers to the line before it.
+                elif raw_line.startswith("\\") and current_hunk is not None:
+                    if not current_hunk.lines:
+                        raise PatchParseError(
+                            f"Line {line_no}: Found 'No newline' marker before any hunk content"
+                        )
+                    current_hunk.lines[-1].has_newline = False
+
+                # 5. Handle Metadata and Noise
                 else:
                     # STRICT RULE: No unrecognized lines allowed inside a hunk block
                     if current_hunk is not None:
@@ -1245,6 +1312,10 @@ class FtwPatch:
     and providing command-line arguments via read-only properties (getters).
     """
 
+    #: Puffergröße für das Einlesen der Patch-Datei; kleine Patches
+    #: werden so mit einem einzigen read()-Aufruf geladen.
+    _STREAM_BUFFER_SIZE: ClassVar[int] = 65536
+
     def __init__(self, args: Namespace) -> None:
         """
         Initializes the FtwPatch instance by storing the parsed command-line
@@ -1271,6 +1342,23 @@ class FtwPatch:
         # self.__class__.__name__ erfüllt die Anforderung für Vererbung
         return f"{self.__class__.__name__}(patch_file={self._args.patch_file!r})"
 
+    @classmethod
+    def from_options(cls, patch_file: Path, target_directory: Path, **options) -> "FtwPatch":
+        """
+        Create an FtwPatch instance from keyword options instead of argparse.
+
+        Intended for programmatic use, where no command line has been parsed.
+        The options are wrapped in a Namespace, so the instance behaves exactly
+        like one created by ``prog_ftw_patch``.
+
+        :param patch_file: The path to the patch or diff file.
+        :param target_directory: The directory containing the files to be patched.
+        :param options: Further attributes, e.g. strip_count or dry_run.
+        :returns: A new FtwPatch instance.
+        :raises FileNotFoundError: If the patch file does not exist **(Indirect)**.
+        """
+        return cls(Namespace(patch_file=patch_file, target_directory=target_directory, **options))
+
     @property
     def patch_file_path(self) -> Path:
         """
@@ -1367,7 +1455,9 @@ class FtwPatch:
         :returns: A file stream object.
         """
         # self._args.patch_file ist ein Path-Objekt aus argparse
-        return self._args.patch_file.open("r", encoding="utf-8")
+        return self._args.patch_file.open(
+            "r", buffering=self._STREAM_BUFFER_SIZE, encoding="utf-8"
+        )
 
     def _parse(self) -> None:
         """
@@ -1431,9 +1521,9 @@ class FtwPatch:
                     staged_path = staging_dir / source_tmp_path
                     # f"{code_file.get_source_path(options.strip_count).name}_{id(code_file)}.tmp"
 
+                    # Ein einziger write() statt eines Aufrufs pro Zeile
                     with staged_path.open("w", encoding="utf-8") as f:
-                        for line in patched_lines:
-                            f.write(line.line_string)
+                        f.write("".join(line.line_string for line in patched_lines))
 
                     staged_results.append((source_path, staged_path))
 
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+#: Read-only Patch-Dateien, die sich mehrere Tests teilen.
+#: Tests, die eine Datei verändern oder löschen, legen weiterhin
+#: ihre eigene Kopie unter ``tmp_path`` an.
+#: Die Inhalte liegen bereits UTF-8-kodiert vor und werden binär geschrieben.
+_PATCH_CORPUS: dict[str, bytes] = {
+    "simple": b"--- a/file\n+++ b/file\n@@ -1,1 +1,1 @@\n-old\n+new",
+    "header_only": b"--- a/app.py\n+++ b/app.py\n",
+    "plain_text": b"patch content",
+}
+
+
+@pytest.fixture(scope="session")
+def patch_corpus(tmp_path_factory) -> dict[str, Path]:
+    """Schreibt den Patch-Korpus einmal pro Testlauf und liefert Name -> Pfad."""
+    corpus_dir = tmp_path_factory.mktemp("patch_corpus")
+    corpus = {}
+    for name, data in _PATCH_CORPUS.items():
+        path = corpus_dir / f"{name}.patch"
+        path.write_bytes(data)
+        corpus[name] = path
+    return corpus
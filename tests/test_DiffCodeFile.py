@@ -1,3 +1,5 @@
+import difflib
+import tempfile
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -11,9 +13,25 @@ from fitzzftw.patch.ftw_patch import (
     Hunk,
     HunkHeadLine,
     PatchParseError,
+    PatchParser,
 )
 
 
+class _FailingPath:
+    """Minimaler Path-Ersatz, dessen open() immer mit OSError scheitert."""
+
+    __slots__ = ("_message",)
+
+    def __init__(self, message: str) -> None:
+        self._message = message
+
+    def open(self, *args, **kwargs):
+        raise OSError(self._message)
+
+    def __str__(self) -> str:
+        return "failing/path.txt"
+
+
 class TestDiffCodeFile:
     """Tests for the DiffCodeFile container class."""
 
@@ -66,7 +84,6 @@ class TestDiffCodeFile:
 
     def test_temp_path_generation(self):
         """Verify _temp_path is in temp directory and unique per instance."""
-        import tempfile
         dcf1 = DiffCodeFile(self.header_orig)
         dcf2 = DiffCodeFile(self.header_orig)
         
@@ -91,20 +108,17 @@ class TestDiffCodeFile:
         assert isinstance(dcf.get_source_path(), Path)
 
 
-    def test_read_file_exception(self, mocker):
+    def test_read_file_exception(self):
         """
         Simulate an OSError to verify FtwPatchError conversion (Lines 967-977).
         """
         dcf = DiffCodeFile(self.header_orig)
         
-        # 1. Wir erstellen ein Mock-Objekt, das vorgibt ein Path zu sein
-        mock_path = mocker.MagicMock(spec=Path)
-        
-        # 2. WICHTIG: Wir sagen diesem spezifischen Objekt, dass sein .open() 
-        # eine Exception werfen soll. Das ist viel sicherer als globale Patches.
-        mock_path.open.side_effect = OSError("Disk failure")
+        # 1. Ein Path-Ersatz, dessen .open() eine Exception wirft. Das ist
+        # viel sicherer als globale Patches.
+        mock_path = _FailingPath("Disk failure")
         
-        # 3. Wir rufen die Methode mit unserem "kaputten" Pfad auf
+        # 2. Wir rufen die Methode mit unserem "kaputten" Pfad auf
         with pytest.raises(FtwPatchError, match="Could not read file"):
             dcf._read_file(mock_path)
 
@@ -131,15 +145,30 @@ class TestDiffCodeFile:
         # Verify the line string was written to the stream
         m_open().write.assert_called_once_with("line1\n")
 
+    def test_write_to_staging_single_write(self, mocker):
+        """
+        Verify that all lines reach the staging file in one write() call.
+        """
+        dcf = DiffCodeFile(self.header_orig)
+        mock_path = mocker.MagicMock(spec=Path)
+        mocker.patch.object(
+            DiffCodeFile, '_temp_path', new_callable=mocker.PropertyMock, return_value=mock_path
+        )
+        m_open = mocker.mock_open()
+        mocker.patch.object(mock_path, 'open', m_open)
+
+        dcf._write_to_staging([FileLine("line1\n"), FileLine("line2\n"), FileLine("line3")])
+
+        m_open().write.assert_called_once_with("line1\nline2\nline3")
+
     def test_write_to_staging_error(self, mocker):
         """
         Verify FtwPatchError is raised when writing to staging fails (Lines 1030-1038).
         """
         dcf = DiffCodeFile(self.header_orig)
         
-        mock_path = mocker.MagicMock(spec=Path)
         # Simulate disk error on open
-        mock_path.open.side_effect = OSError("No space left on device")
+        mock_path = _FailingPath("No space left on device")
         mocker.patch.object(DiffCodeFile, '_temp_path', new_callable=mocker.PropertyMock, return_value=mock_path)
         
         with pytest.raises(FtwPatchError, match="Could not write to staging file"):
@@ -223,6 +252,31 @@ class TestDiffCodeFile:
         mock_path.open.assert_called_once()
         mock_hunk.apply.assert_called_once()
 
+    def test_apply_two_hunks_difflib_round_trip(self, tmp_path):
+        """
+        Apply a two-hunk patch generated by difflib to a real file.
+        The patch text is derived from before/after instead of being written by hand.
+        """
+        before = ["line1\n", "line2\n", "line3\n", "line4\n", "line5\n"]
+        after = ["MOD1\n", "line2\n", "line3\n", "MOD4\n", "line5\n"]
+        source = tmp_path / "mod1.txt"
+        source.write_text("".join(before))
+
+        # n=0: ohne Kontext entstehen zwei getrennte Hunks
+        patch = difflib.unified_diff(
+            before, after, fromfile=str(source), tofile=str(source), n=0
+        )
+        dcf, = PatchParser().iter_files(patch)
+        assert len(dcf) == 2
+
+        opts = SimpleNamespace(
+            strip_count=0,
+            ignore_blank_lines=False,
+            ignore_all_space=False,
+            ignore_space_change=False,
+        )
+        assert [line.line_string for line in dcf.apply(opts)] == after
+
     def test_diff_code_file_init_with_wrong_header_type(self):
         """
         Ensure DiffCodeFile rejects initialization with a 'new' header (+++).
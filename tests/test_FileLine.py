@@ -20,9 +20,8 @@ class TestFileLine:
 
     def test_invalid_input_raises_patch_parse_error(self):
         """Checks if the correct PatchParseError is raised for non-string input."""
-        with pytest.raises(PatchParseError) as excinfo:
+        with pytest.raises(PatchParseError, match="expected a string"):
             FileLine(None)
-        assert "expected a string" in str(excinfo.value)
 
     def test_strips_only_trailing_newline(self):
         """Verifies that only the newline is removed, keeping trailing spaces."""
@@ -115,3 +114,20 @@ class TestFileLine:
         fl_no_nl = FileLine("data")
         fl_no_nl.has_newline = False
         assert fl_no_nl.line_string == "data"
+
+    def test_normalized_contents_are_cached(self):
+        """Verifies that the normalized variants are computed once and reused."""
+        fl = FileLine("  a \t b  ")
+        first_norm = fl.normalized_ws_content
+        first_all = fl.ignore_all_ws_content
+
+        assert first_norm == "  a b"
+        assert first_all == "ab"
+        assert fl.normalized_ws_content is first_norm
+        assert fl.ignore_all_ws_content is first_all
+
+    @pytest.mark.parametrize("ws_char", [" ", "\t", "\r", "\f", "\v", "\xa0", "\u2003", "\u3000"])
+    def test_ignore_all_ws_removes_unicode_whitespace(self, ws_char):
+        """Ensures --ignore-all-ws strips ASCII as well as Unicode whitespace."""
+        fl = FileLine(f"{ws_char}a{ws_char}b{ws_char}")
+        assert fl.ignore_all_ws_content == "ab"
@@ -1,10 +1,23 @@
+import shutil
 from argparse import Namespace
 from pathlib import Path
 
 import pytest
 
+import fitzzftw.patch.ftw_patch as patch_module
 from fitzzftw.patch.ftw_patch import FtwPatch, FtwPatchError, PatchParseError
 
+#: Konstante Optionen für FtwPatch; pro Test werden nur
+#: patch_file und target_directory ergänzt.
+_BASE_ARGS = Namespace(
+    strip_count=1,
+    normalize_whitespace=True,
+    ignore_blank_lines=False,
+    ignore_all_whitespace=True,
+    dry_run=True,
+    verbose=0,
+)
+
 
 class TestFtwPatch:
     """
@@ -12,21 +25,21 @@ class TestFtwPatch:
     Deckt Properties, Initialisierung und das Error-Handling der run-Methode ab.
     """
 
+    @pytest.fixture(scope="module")
+    def target_dir(self, tmp_path_factory):
+        """
+        Gemeinsames Zielverzeichnis für alle Tests des Moduls.
+        FtwPatch schreibt nie direkt hinein; Tests mit eigenen Dateien nutzen tmp_path.
+        """
+        return tmp_path_factory.mktemp("target")
+
     @pytest.fixture
-    def valid_args(self, tmp_path):
+    def valid_args(self, patch_corpus, target_dir):
         """Erzeugt einen validen Namespace für die Initialisierung."""
-        patch_file = tmp_path / "test.patch"
-        patch_file.write_text("--- a/file\n+++ b/file\n@@ -1,1 +1,1 @@\n-old\n+new")
-        
         return Namespace(
-            patch_file=patch_file,
-            strip_count=1,
-            target_directory=tmp_path,
-            normalize_whitespace=True,
-            ignore_blank_lines=False,
-            ignore_all_whitespace=True,
-            dry_run=True,
-            verbose = 0
+            **vars(_BASE_ARGS),
+            patch_file=patch_corpus["simple"],
+            target_directory=target_dir,
         )
 
     ## --- Tests für Initialisierung und Properties ---
@@ -36,12 +49,21 @@ class TestFtwPatch:
         app = FtwPatch(valid_args)
         assert app.patch_file_path == valid_args.patch_file
 
+    def test_from_options_matches_namespace_init(self, valid_args):
+        """Prüft, dass from_options() dieselben Properties liefert wie __init__."""
+        app = FtwPatch.from_options(**vars(valid_args))
+
+        assert isinstance(app, FtwPatch)
+        assert app.patch_file_path == valid_args.patch_file
+        assert app.target_directory == valid_args.target_directory
+        assert app.strip_count == valid_args.strip_count
+        assert app.dry_run is True
+
     def test_init_raises_file_not_found(self):
         """Prüft den proaktiven Check auf Existenz der Patch-Datei."""
         bad_args = Namespace(patch_file=Path("/tmp/non_existent_patch_123.diff"))
-        with pytest.raises(FileNotFoundError) as excinfo:
+        with pytest.raises(FileNotFoundError, match="Patch file not found"):
             FtwPatch(bad_args)
-        assert "Patch file not found" in str(excinfo.value)
 
     def test_all_properties_passthrough(self, valid_args):
         """Verifiziert, dass alle Namespace-Attribute korrekt durchgereicht werden."""
@@ -63,31 +85,26 @@ class TestFtwPatch:
     ## --- Tests für die run() Methode (Error Handling) ---
 
 
-    def test_run_success_code_zero(self, mocker, valid_args):
-        """Prüft, ob run() bei Erfolg 0 zurückgibt."""
+    @pytest.mark.parametrize("apply_behaviour, expected_code, expected_output", [
+        # Erfolg: apply() läuft durch, keine Ausgabe
+        ({"return_value": 0}, 0, ""),
+        # Bekannte Fehler (FtwPatchError) liefern Code 1
+        ({"side_effect": FtwPatchError("Specific Path Error")}, 1,
+         "\nPatch failed: Specific Path Error\n"),
+        # Unvorhergesehene Fehler werden abgefangen und liefern Code 2
+        ({"side_effect": Exception("Unexpected System Failure")}, 2,
+         "\nAn unexpected error occurred: Unexpected System Failure\n"),
+    ], ids=["success", "known_error", "unexpected_error"])
+    def test_run_exit_codes(
+        self, mocker, capsys, valid_args, apply_behaviour, expected_code, expected_output
+    ):
+        """Prüft Exit-Code und Fehlermeldung von run() je nach Ausgang von apply()."""
         app = FtwPatch(valid_args)
         # Wir mocken 'apply', da dies die Methode ist, die run() aufruft
-        mocker.patch.object(app, 'apply', return_value=0)
+        mocker.patch.object(app, 'apply', **apply_behaviour)
         
-        assert app.run() == 0
-
-    def test_run_known_error_code_one(self, mocker, valid_args):
-        """Prüft, ob FtwPatchError (bekannte Fehler) Code 1 liefert."""
-        app = FtwPatch(valid_args)
-        mocker.patch.object(app, 'apply', side_effect=FtwPatchError("Specific Path Error"))
-        
-        assert app.run() == 1
-
-    def test_run_unexpected_error_code_two(self, mocker, valid_args):
-        """
-        Prüft, ob die allgemeine Exception (unvorhergesehene Fehler) 
-        abgefangen wird und Code 2 liefert.
-        """
-        app = FtwPatch(valid_args)
-        # Wir werfen die oberste Basis-Exception für Laufzeitfehler
-        mocker.patch.object(app, 'apply', side_effect=Exception("Unexpected System Failure"))
-        
-        assert app.run() == 2
+        assert app.run() == expected_code
+        assert capsys.readouterr().out == expected_output
 
     def test_create_backups_success(self, valid_args, tmp_path):
         """Prüft, ob Backups für mehrere Dateien korrekt erstellt werden."""
@@ -116,14 +133,12 @@ class TestFtwPatch:
         
         # Simuliere Fehler beim zweiten Kopier-Vorgang
         # Wir mocken shutil.copy2 (via copy2 im Namespace von ftw_patch)
-        import fitzzftw.patch.ftw_patch as patch_module
         mock_copy = mocker.patch.object(patch_module, 'copy2')
         mock_copy.side_effect = [None, OSError("Disk Full")]
         
-        with pytest.raises(PatchParseError) as excinfo:
+        with pytest.raises(PatchParseError, match="Mandatory backup failed"):
             app._create_backups([file1, file2])
         
-        assert "Mandatory backup failed" in str(excinfo.value)
         # Sicherstellen, dass das erste Backup wieder gelöscht wurde (Cleanup)
         assert not Path(str(file1) + ".ftwBak").exists()
 
@@ -134,7 +149,6 @@ class TestFtwPatch:
         Tests lines 1401-1429: Verifies that OSError is caught, 
         handled via rollback, and re-raised as FtwPatchError.
         """
-        import shutil
         app = FtwPatch(valid_args)
         
         # Setup files
@@ -150,14 +164,13 @@ class TestFtwPatch:
         options = Namespace(backup=True)
 
         # WICHTIG: Patch 'move' direkt in deinem Modul, nicht in shutil!
-        mocker.patch("fitzzftw.patch.ftw_patch.move", side_effect=OSError("Disk write protected"))
-        
-        with pytest.raises(FtwPatchError) as excinfo:
-            app._commit_changes(results, options)
+        mocker.patch.object(patch_module, "move", side_effect=OSError("Disk write protected"))
         
         # Wir passen den String an deine tatsächliche Fehlermeldung an:
-        assert "Critical error during file move" in str(excinfo.value)
-        assert "Disk write protected" in str(excinfo.value)
+        with pytest.raises(
+            FtwPatchError, match="Critical error during file move: Disk write protected"
+        ):
+            app._commit_changes(results, options)
         
         # Verify the rollback
         assert original.read_text() == "safe_original_content"
@@ -243,16 +256,25 @@ class TestFtwPatch:
         # Assert: Backup must still exist
         assert bak_file.exists()
 
-    def test_get_patch_stream_success(self, valid_args, tmp_path):
+    def test_get_patch_stream_success(self, valid_args, patch_corpus):
         """Tests if the stream is opened correctly for a valid file."""
-        patch_file = tmp_path / "test.patch"
-        patch_file.write_text("patch content")
-        valid_args.patch_file = patch_file
+        valid_args.patch_file = patch_corpus["plain_text"]
         app = FtwPatch(valid_args)
         
         with app._get_patch_stream() as stream:
             assert stream.read() == "patch content"
 
+    def test_get_patch_stream_uses_large_buffer(self, valid_args, mocker):
+        """Tests that the patch stream is opened with the explicit buffer size."""
+        app = FtwPatch(valid_args)
+        mock_open = mocker.patch.object(Path, "open")
+
+        app._get_patch_stream()
+
+        mock_open.assert_called_once_with(
+            "r", buffering=FtwPatch._STREAM_BUFFER_SIZE, encoding="utf-8"
+        )
+
     def test_get_patch_stream_deleted_after_init(self, valid_args, tmp_path):
         """
         Tests the (Indirect) FileNotFoundError if the file is removed 
@@ -260,7 +282,7 @@ class TestFtwPatch:
         """
         # 1. Setup: Create file so __init__ check passes
         patch_file = tmp_path / "temporary.patch"
-        patch_file.write_text("dummy content")
+        patch_file.write_bytes(b"dummy content")
         valid_args.patch_file = patch_file
         
         # 2. Instantiation (proactive check succeeds)
@@ -273,14 +295,12 @@ class TestFtwPatch:
         with pytest.raises(FileNotFoundError):
             app._get_patch_stream()
 
-    def test_parsed_files_caching_logic(self, valid_args, tmp_path):
+    def test_parsed_files_caching_logic(self, valid_args, patch_corpus):
         """
         Tests that _parse is only called when _patch_files is None and 
         results are cached thereafter.
         """
-        patch_file = tmp_path / "caching.patch"
-        patch_file.write_text("--- a/app.py\n+++ b/app.py\n") # Minimal diff
-        valid_args.patch_file = patch_file
+        valid_args.patch_file = patch_corpus["header_only"] # Minimal diff
         app = FtwPatch(valid_args)
         
         # 1. First access: Should trigger _parse
@@ -293,63 +313,13 @@ class TestFtwPatch:
         files_second_call = app.parsed_files
         assert files_first_call is files_second_call
 
-    def Test_apply_successful_patch(self, valid_args, tmp_path):
-        """
-        Covers lines 1329-1354: Tests the core patching logic.
-        Verifies that a valid patch is applied to a source file and
-        results in a correctly staged temporary file.
-        """
-        app = FtwPatch(valid_args)
-        
-        # 1. Setup: Source file to be patched
-        source_file = tmp_path / "app.py"
-        source_content = "def hello():\n    print('hello')\n"
-        source_file.write_text(source_content)
-        
-        # 2. Setup: A simple unified diff patch
-        # Note: Ensure the paths in the patch match the file name
-        patch_content = (
-            "--- app.py\n"
-            "+++ app.py\n"
-            "@@ -1,2 +1,2 @@\n"
-            " def hello():\n"
-            "-    print('hello')\n"
-            "+    print('world')\n"
-        )
-        patch_file = tmp_path / "fix.patch"
-        patch_file.write_text(patch_content)
-        
-        # Update app args to point to the new patch file
-        # Check if your class uses self.args or self._args internally
-        app._args.patch_file = patch_file
-        
-        # 3. Execution - Passing the required options argument
-        results = app.apply(valid_args)
-        
-        # 4. Assertions
-        assert len(results) == 1
-        original_path, staged_path = results[0]
-        
-        # We check if the staged path is indeed a file and has the new content
-        assert original_path.name == "app.py"
-        assert staged_path.exists()
-        
-        patched_content = staged_path.read_text()
-        assert "print('world')" in patched_content
-
-
-
-
-    def test_apply_full_staging_workflow(self, valid_args, tmp_path, mocker):
+    def test_apply_full_staging_workflow(self, valid_args, mocker):
         """
         Tests the staging workflow by intercepting _commit_changes.
         Verification happens inside the mock to ensure files exist 
         before the TemporaryDirectory is destroyed.
         """
-        # 1. Setup
-        patch_file = tmp_path / "test.patch"
-        patch_file.write_text("--- a/app.py\n+++ b/app.py\n")
-        valid_args.patch_file = patch_file
+        # 1. Setup (parsed_files is mocked, the shared patch file suffices)
         valid_args.dry_run = False
         app = FtwPatch(valid_args)
         
@@ -382,16 +352,13 @@ class TestFtwPatch:
         # 4. Final check: Ensure the interceptor was actually triggered
         mock_commit.assert_called_once()
 
-    def test_apply_exception_re_raise(self, valid_args, tmp_path, mocker):
+    def test_apply_exception_re_raise(self, valid_args, mocker):
         """
         Covers the exception re-raise block (Lines 1423-1425).
         Verifies that a FtwPatchError inside the staging loop is 
         properly passed through.
         """
-        # 1. Setup: Valid instance
-        patch_file = tmp_path / "test.patch"
-        patch_file.write_text("--- a/f.py\n+++ b/f.py\n")
-        valid_args.patch_file = patch_file
+        # 1. Setup: Valid instance (parsed_files is mocked below)
         app = FtwPatch(valid_args)
 
         # 2. Provoke failure: Let the property raise an error when accessed
@@ -403,10 +370,8 @@ class TestFtwPatch:
         )
 
         # 3. Verification: The 'except' block must catch and raise it
-        with pytest.raises(FtwPatchError) as exc_info:
+        with pytest.raises(FtwPatchError, match="Simulated failure during loop"):
             app.apply(valid_args)
-        
-        assert "Simulated failure during loop" in str(exc_info.value)
 
     def test_apply_honors_dry_run_protection(self, valid_args, mocker):
         """
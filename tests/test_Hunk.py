@@ -10,6 +10,13 @@ from fitzzftw.patch.ftw_patch import (
     HunkLine,
 )
 
+_BASE_OPTS = dict(ignore_blank_lines=False, ignore_all_space=False, ignore_space_change=False)
+
+_OPTS_DEFAULT = SimpleNamespace(**_BASE_OPTS)
+_OPTS_IGNORE_ALL_WS = SimpleNamespace(**{**_BASE_OPTS, "ignore_all_space": True})
+_OPTS_IGNORE_CHANGE_WS = SimpleNamespace(**{**_BASE_OPTS, "ignore_space_change": True})
+_OPTS_IGNORE_BLANKS = SimpleNamespace(**{**_BASE_OPTS, "ignore_blank_lines": True})
+
 
 class TestHunk:
     """Tests for the Hunk container class with direct internal state verification."""
@@ -26,27 +33,11 @@ class TestHunk:
         self.line_add = HunkLine("+added")
         self.line_del = HunkLine("-removed")
 
-        # Option Namespaces (Centralized as you suggested)
-        self.opts_default = SimpleNamespace(
-            ignore_blank_lines=False,
-            ignore_all_space=False,
-            ignore_space_change=False
-        )
-        self.opts_ignore_all_ws = SimpleNamespace(
-            ignore_blank_lines=False,
-            ignore_all_space=True,
-            ignore_space_change=False
-        )
-        self.opts_ignore_change_ws = SimpleNamespace(
-            ignore_blank_lines=False,
-            ignore_all_space=False,
-            ignore_space_change=True
-        )
-        self.opts_ignore_blanks = SimpleNamespace(
-            ignore_blank_lines=True,
-            ignore_all_space=False,
-            ignore_space_change=False
-        )
+        # Option Namespaces (shared, read-only module constants)
+        self.opts_default = _OPTS_DEFAULT
+        self.opts_ignore_all_ws = _OPTS_IGNORE_ALL_WS
+        self.opts_ignore_change_ws = _OPTS_IGNORE_CHANGE_WS
+        self.opts_ignore_blanks = _OPTS_IGNORE_BLANKS
 
     def test_init_sets_internal_header(self):
         """Verify that the HunkHeadLine is correctly stored internally."""
@@ -194,6 +185,22 @@ class TestHunk:
         # Verify result contains FileLine objects, not HunkLines
         assert isinstance(result[1], FileLine)
 
+    def test_apply_keeps_original_context_lines(self):
+        """Context lines are taken over from the file, not rebuilt from the hunk."""
+        hunk = Hunk(self.header_std)
+        hunk.add_line(HunkLine(" context"))
+        hunk.add_line(HunkLine("-removed"))
+        hunk.add_line(HunkLine(" tail"))
+
+        file_content = [FileLine("context\n"), FileLine("removed\n"), FileLine("tail")]
+
+        result = hunk.apply(file_content, self.opts_default)
+
+        assert [line.content for line in result] == ["context", "tail"]
+        assert result[0] is file_content[0]
+        # The missing newline at EOF of the original file survives
+        assert result[1].line_string == "tail"
+
     def test_apply_out_of_bounds(self):
         """Verify error when hunk exceeds file line count."""
         # Header starts at line 10, but file only has 2 lines
@@ -214,3 +221,8 @@ class TestHunk:
         
         with pytest.raises(FtwPatchError, match="actual file content does not match"):
             hunk.apply(file_content, self.opts_default)
+
+    def test_hunk_uses_slots(self):
+        """Ensure Hunk containers carry no per-instance __dict__."""
+        hunk = Hunk(self.header_std)
+        assert not hasattr(hunk, "__dict__")
@@ -47,9 +47,8 @@ class TestHunkLine:
         This covers Line 586 and its internal branches.
         """
         # Case 1: Invalid prefix (e.g., a letter 'a' instead of ' ', '+', '-')
-        with pytest.raises(PatchParseError) as excinfo:
+        with pytest.raises(PatchParseError, match="missing valid prefix"):
             HunkLine("a invalid line")
-        assert "missing valid prefix" in str(excinfo.value)
 
         # Case 2: Empty string (The 'not raw_line' part of the check)
         with pytest.raises(PatchParseError):
@@ -72,5 +71,11 @@ class TestHunkLine:
         hl_nl = HunkLine(" context line")
         hl_nl.has_newline = True
         assert hl_nl.has_newline is True
-        # Ensure the line_string (if you have it) would include the newline
-        # assert hl_nl.line_string().endswith('\n')
+        assert hl_nl.line_string.endswith("\n")
+
+    def test_hunk_line_uses_slots(self):
+        """Ensure HunkLine instances carry no per-instance __dict__."""
+        hl = HunkLine("+added")
+        assert not hasattr(hl, "__dict__")
+        with pytest.raises(AttributeError):
+            hl.unknown_attribute = True
@@ -18,11 +18,9 @@ class TestPatchLine:
 
     def test_initialization_raises_parser_error_on_none(self):
         """Ensures FTWParserError is raised when raw_line is None."""
-        with pytest.raises(PatchParseError) as excinfo:
-            PatchLine(None)
-        
         # Optional: Prüfen, ob die Fehlermeldung den richtigen Hinweis enthält
-        assert "received None" in str(excinfo.value)
+        with pytest.raises(PatchParseError, match="received None"):
+            PatchLine(None)
         
     @pytest.mark.parametrize("invalid_input", [
         None, 
@@ -38,11 +36,9 @@ class TestPatchLine:
         Ensures FTWParserError is raised for any non-string input.
         This enforces strict type safety for patch processing.
         """
-        with pytest.raises(PatchParseError) as excinfo:
-            PatchLine(invalid_input)
-        
         # Verify that the error message contains the type name for better debugging
-        assert "expected a string" in str(excinfo.value)
+        with pytest.raises(PatchParseError, match="expected a string"):
+            PatchLine(invalid_input)
 
     def test_property_content_is_read_only(self):
         """Ensures the content property cannot be modified directly."""
@@ -54,7 +50,6 @@ class TestPatchLine:
         """Checks if the string conversion returns the stored content."""
         content = "Standard line"
         line = PatchLine(content)
-        # assert str(line) == content
         assert str(line) == "PatchLine(Content: 'Standard line')"
 
 